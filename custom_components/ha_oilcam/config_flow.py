@@ -15,6 +15,7 @@ from .const import (
     CONF_COLOR_FULL,
     CONF_COLOR_LOW,
     CONF_COLOR_MEDIUM,
+    CONF_DEADBAND,
     CONF_HOST,
     CONF_LEVEL_LOW,
     CONF_LEVEL_MEDIUM,
@@ -24,7 +25,9 @@ from .const import (
     CONF_THRESHOLD_MIN,
     CONF_UPDATE_CYCLE,
     CONF_URL,
+    CONF_USE_CALIBRATION,
     CONF_ZIPCODE,
+    DEFAULT_DEADBAND,
     DOMAIN,
 )
 
@@ -41,8 +44,12 @@ CONFIG_SCHEMA = vol.Schema(
         vol.Required(CONF_ZIPCODE, default="97222"): str,
         vol.Required(CONF_REGION, default="880,130,910,1070"): str,
         vol.Required(CONF_THRESHOLD_MIN, default=140): cv.positive_int,
+        vol.Required(CONF_USE_CALIBRATION, default=False): cv.boolean,
         vol.Required(CONF_THRESHOLD_MAX, default=255): cv.positive_int,
         vol.Required(CONF_CAPACITY, default=2400): cv.positive_int,
+        vol.Required(CONF_DEADBAND, default=DEFAULT_DEADBAND): vol.All(
+            vol.Coerce(float), vol.Range(min=0)
+        ),
         vol.Required(CONF_LEVEL_LOW, default=10): cv.positive_int,
         vol.Required(CONF_LEVEL_MEDIUM, default=50): cv.positive_int,
         vol.Required(CONF_COLOR_LOW, default="#FF0000"): str,
@@ -132,6 +139,10 @@ class OilcamOptionsFlow(config_entries.OptionsFlow):
                         CONF_THRESHOLD_MIN,
                         default=self.config_entry.data.get(CONF_THRESHOLD_MIN, 140),
                     ): cv.positive_int,
+                    vol.Required(
+                        CONF_USE_CALIBRATION,
+                        default=self.config_entry.data.get(CONF_USE_CALIBRATION, False),
+                    ): cv.boolean,
                     vol.Required(
                         CONF_THRESHOLD_MAX,
                         default=self.config_entry.data.get(CONF_THRESHOLD_MAX, 255),
@@ -140,6 +151,12 @@ class OilcamOptionsFlow(config_entries.OptionsFlow):
                         CONF_CAPACITY,
                         default=self.config_entry.data.get(CONF_CAPACITY, 2400),
                     ): cv.positive_int,
+                    vol.Required(
+                        CONF_DEADBAND,
+                        default=self.config_entry.data.get(
+                            CONF_DEADBAND, DEFAULT_DEADBAND
+                        ),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0)),
                     vol.Required(
                         CONF_LEVEL_LOW,
                         default=self.config_entry.data.get(CONF_LEVEL_LOW, 10),
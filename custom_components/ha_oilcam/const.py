@@ -9,7 +9,9 @@ CONF_ZIPCODE = "zipcode"
 CONF_REGION = "region"
 CONF_THRESHOLD_MIN = "threshold_min"
 CONF_THRESHOLD_MAX = "threshold_max"
+CONF_USE_CALIBRATION = "use_calibration"
 CONF_CAPACITY = "capacity"
+CONF_DEADBAND = "deadband"
 CONF_HOST = "host"
 CONF_LEVEL_LOW = "levelLow"
 CONF_LEVEL_MEDIUM = "levelMedium"
@@ -17,3 +19,5 @@ CONF_COLOR_LOW = "colorLow"
 CONF_COLOR_MEDIUM = "colorMedium"
 CONF_COLOR_FULL = "colorFull"
 CONF_COLOR_BOX = "colorBox"
+
+DEFAULT_DEADBAND = 0.5
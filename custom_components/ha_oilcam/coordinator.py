@@ -9,6 +9,8 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
+from .const import CONF_USE_CALIBRATION
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -44,6 +46,9 @@ class OilcamDataUpdateCoordinator(DataUpdateCoordinator):
                 "capacity": self.entry.data["capacity"],
                 "zipcode": self.entry.data["zipcode"],
             }
+            if self.entry.data.get(CONF_USE_CALIBRATION, False):
+                # Prefer the threshold stored by /filling-calibrate/, threshold_min stays the fallback
+                params[CONF_USE_CALIBRATION] = "true"
             _LOGGER.debug("Fetching data from %s with params: %s", api_url, params)
             response = await self.hass.async_add_executor_job(
                 requests.get, api_url, params
@@ -16,6 +16,7 @@ from .const import (
     CONF_COLOR_MEDIUM,
     CONF_LEVEL_LOW,
     CONF_LEVEL_MEDIUM,
+    CONF_USE_CALIBRATION,
     DOMAIN,
 )
 from .coordinator import OilcamDataUpdateCoordinator
@@ -103,6 +104,9 @@ class OilcamAnnotatedImage(ImageEntity):
                 "colorFull": self._entry.data[CONF_COLOR_FULL],
                 "colorBox": self._entry.data[CONF_COLOR_BOX],
             }
+            if self._entry.data.get(CONF_USE_CALIBRATION, False):
+                # Prefer the threshold stored by /filling-calibrate/, threshold_min stays the fallback
+                params[CONF_USE_CALIBRATION] = "true"
             response = await self.hass.async_add_executor_job(
                 requests.get, api_url, params
             )
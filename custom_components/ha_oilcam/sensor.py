@@ -4,10 +4,11 @@ import logging
 
 from homeassistant.components.sensor import SensorEntity, SensorEntityDescription
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import CONF_CAPACITY, CONF_DEADBAND, DEFAULT_DEADBAND, DOMAIN
 from .coordinator import OilcamDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -53,11 +54,29 @@ async def async_setup_entry(
 ) -> None:
     """Set up Oilcam sensor entities."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
-    entities = [OilcamSensor(coordinator, entry, desc) for desc in SENSOR_DESCRIPTIONS]
+    entities = [
+        OilcamSensor(coordinator, entry, desc, _deadband_for(entry, desc.key))
+        for desc in SENSOR_DESCRIPTIONS
+    ]
     async_add_entities(entities)
 
 
-class OilcamSensor(SensorEntity):
+def _deadband_for(entry: ConfigEntry, key: str) -> float:
+    """Return the deadband in the sensor's native unit.
+
+    The configured deadband is a percentage of the tank, so it applies to the
+    filling level directly and is scaled to liters for the capacity sensors.
+    Prices are written on every change.
+    """
+    deadband = entry.data.get(CONF_DEADBAND, DEFAULT_DEADBAND)
+    if key == "filling_level":
+        return deadband
+    if key in ["filled_capacity", "empty_capacity"]:
+        return deadband / 100 * entry.data[CONF_CAPACITY]
+    return 0.0
+
+
+class OilcamSensor(CoordinatorEntity[OilcamDataUpdateCoordinator], SensorEntity):
     """Representation of an Oilcam sensor entity."""
 
     def __init__(
@@ -65,50 +84,52 @@ class OilcamSensor(SensorEntity):
         coordinator: OilcamDataUpdateCoordinator,
         entry: ConfigEntry,
         description: SensorEntityDescription,
+        deadband: float,
     ) -> None:
         """Initialize the sensor."""
-        self.coordinator = coordinator
+        super().__init__(coordinator)
         self.entity_description = description
+        self._deadband = deadband
         self._attr_unique_id = f"{entry.entry_id}_{description.key}"
         self._attr_device_info = {
             "identifiers": {(DOMAIN, entry.entry_id)},
             "name": "Oilcam",
             "manufacturer": "Custom",
         }
+        self._last_available = self.available
+        self._update_from_coordinator()
         _LOGGER.debug("Initialized sensor: %s", description.key)
 
     @property
     def available(self) -> bool:
         """Return if the sensor is available."""
-        available = (
-            self.coordinator.last_update_success and self.coordinator.data is not None
-        )
-        _LOGGER.debug(
-            "Sensor %s availability: %s", self.entity_description.key, available
-        )
-        return available
-
-    @property
-    def native_value(self) -> str | float | None:
-        """Return the native value of the sensor."""
-        if not self.available:
-            _LOGGER.debug(
-                "Sensor %s unavailable, returning None", self.entity_description.key
-            )
-            return None
-        value = self.coordinator.data.get(self.entity_description.key)
-        _LOGGER.debug("Sensor %s value: %s", self.entity_description.key, value)
-        return value
+        return super().available and self.coordinator.data is not None
 
-    @property
-    def extra_state_attributes(self) -> dict[str, str] | None:
-        """Return additional state attributes."""
+    def _update_from_coordinator(self) -> None:
+        """Copy the latest coordinator data into the entity attributes."""
+        data = self.coordinator.data or {}
+        self._attr_native_value = data.get(self.entity_description.key)
         if self.entity_description.key in ["oilprice", "refillprice"]:
-            currency = self.coordinator.data.get("currency", "€")
-            _LOGGER.debug(
-                "Sensor %s currency attribute: %s",
-                self.entity_description.key,
-                currency,
-            )
-            return {"currency": currency}
-        return None
+            self._attr_extra_state_attributes = {
+                "currency": data.get("currency", "€")
+            }
+
+    def _exceeds_deadband(self, value: str | float | None) -> bool:
+        """Return if the value moved further than the deadband from the last written one."""
+        current = self._attr_native_value
+        if isinstance(value, (int, float)) and isinstance(current, (int, float)):
+            return abs(value - current) > self._deadband
+        return value != current
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when availability changes or the value leaves the deadband."""
+        data = self.coordinator.data or {}
+        value = data.get(self.entity_description.key)
+        available = self.available
+        if available == self._last_available and not self._exceeds_deadband(value):
+            return
+        _LOGGER.debug("Sensor %s updated: %s", self.entity_description.key, value)
+        self._last_available = available
+        self._update_from_coordinator()
+        self.async_write_ha_state()
@@ -0,0 +1,154 @@
+"""Cache backends shared between the uvicorn/gunicorn worker processes.
+
+The backend is picked with OILCAM_CACHE_URL:
+    memory://                         per-process dict (default, not shared)
+    file:///dev/shm/oilcam-cache      files on a shared tmpfs, one per key
+    redis://localhost:6379/0          Redis or any Redis-compatible server
+
+Shared backends only hold bytes or JSON (tuples come back as lists), never
+pickles, so whoever can write to the cache cannot run code in the service.
+"""
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from urllib.parse import urlparse
+
+RAW_TAG = b"b"
+JSON_TAG = b"j"
+
+
+def encode_value(value) -> bytes:
+    """Serializes bytes as-is and everything else as JSON, prefixed with a type tag."""
+    if isinstance(value, bytes):
+        return RAW_TAG + value
+    return JSON_TAG + json.dumps(value).encode()
+
+
+def decode_value(data: bytes):
+    tag, payload = data[:1], data[1:]
+    if tag == RAW_TAG:
+        return payload
+    if tag == JSON_TAG:
+        return json.loads(payload)
+    raise ValueError(f"Unknown cache value tag: {tag!r}")
+
+
+class CacheBackend:
+    """Minimal get/set-with-TTL interface the app needs from a cache."""
+
+    def get(self, key: str):
+        """Returns the cached value, or None if it is missing or expired."""
+        raise NotImplementedError
+
+    def set(self, key: str, value, ttl: float):
+        raise NotImplementedError
+
+
+class MemoryCache(CacheBackend):
+    """In-process cache; each worker keeps its own copy."""
+
+    MAX_ENTRIES = 1024
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str):
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None or entry[0] < time.time():
+            return None
+        return entry[1]
+
+    def set(self, key: str, value, ttl: float):
+        now = time.time()
+        with self._lock:
+            # Re-insert so the dict stays ordered from least to most recently set
+            self._entries.pop(key, None)
+            if len(self._entries) >= self.MAX_ENTRIES:
+                self._entries = {k: v for k, v in self._entries.items() if v[0] >= now}
+            while len(self._entries) >= self.MAX_ENTRIES:
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = (now + ttl, value)
+
+
+class FileCache(CacheBackend):
+    """One file per key in a shared directory, ideally on tmpfs (/dev/shm).
+
+    The file's mtime holds the expiry time, so lookups and purges only need a stat.
+    """
+
+    PURGE_EVERY = 256  # sets between purges of expired files
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        self._sets = 0
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, hashlib.sha1(key.encode()).hexdigest() + ".cache")
+
+    def get(self, key: str):
+        path = self._path(key)
+        try:
+            if os.stat(path).st_mtime < time.time():
+                return None
+            with open(path, "rb") as f:
+                return decode_value(f.read())
+        except (OSError, ValueError):
+            return None
+
+    def set(self, key: str, value, ttl: float):
+        expires = time.time() + ttl
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(encode_value(value))
+        os.utime(tmp_path, (expires, expires))
+        # Atomic rename, so other workers never read a partial file
+        os.replace(tmp_path, self._path(key))
+
+        self._sets += 1
+        if self._sets % self.PURGE_EVERY == 0:
+            self.purge()
+
+    def purge(self):
+        now = time.time()
+        for entry in os.scandir(self.directory):
+            try:
+                if entry.name.endswith(".cache") and entry.stat().st_mtime < now:
+                    os.remove(entry.path)
+            except OSError:
+                pass
+
+
+class RedisCache(CacheBackend):
+    """Cache on a Redis-compatible server (Redis, Valkey, KeyDB, ...)."""
+
+    def __init__(self, url: str):
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError("Redis cache requires the redis package (pip install redis)")
+        self._client = redis.Redis.from_url(url)
+
+    def get(self, key: str):
+        data = self._client.get(key)
+        return decode_value(data) if data is not None else None
+
+    def set(self, key: str, value, ttl: float):
+        self._client.set(key, encode_value(value), px=int(ttl * 1000))
+
+
+def create_cache(url: str) -> CacheBackend:
+    """Creates the cache backend for a memory://, file:// or redis:// URL."""
+    parsed = urlparse(url)
+    if parsed.scheme == "memory":
+        return MemoryCache()
+    if parsed.scheme == "file":
+        return FileCache(parsed.path)
+    if parsed.scheme in ("redis", "rediss", "unix"):
+        return RedisCache(url)
+    raise ValueError(f"Unsupported cache URL: {url}")
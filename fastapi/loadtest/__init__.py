@@ -0,0 +1,9 @@
+"""Local load-test harness for the Oilcam analysis service.
+
+Run each part from the fastapi/ directory, in separate shells:
+
+    python -m loadtest.fake_camera --port 8001 --latency 0.3
+    python -m loadtest.fake_pricesite --port 8002 --latency 0.5
+    OILCAM_OILPRICE_URL=http://localhost:8002/ uvicorn app:app --port 8000 --workers 4
+    python -m loadtest.loadgen --tanks 200 --update-cycle 60 --duration 600
+"""
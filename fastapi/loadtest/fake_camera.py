@@ -0,0 +1,72 @@
+"""Fake Thingino camera serving synthetic tank snapshots.
+
+Every camera id gets its own slowly draining tank, so /cam/<id>/image.jpg
+behaves like one real camera per Home Assistant config entry.
+"""
+import argparse
+import asyncio
+import random
+import time
+
+import numpy as np
+import cv2
+import uvicorn
+from fastapi import FastAPI, Response
+
+FRAME_WIDTH = 1920
+FRAME_HEIGHT = 1080
+TANK_REGION = (1160, 40, 1200, 1050)  # matches the app.py default region
+LEVEL_STEPS = 101  # pre-rendered frames, one per percent
+DRAIN_PERIOD = 3600.0  # seconds for a tank to go from full to empty
+
+app = FastAPI()
+latency = 0.0
+jitter = 0.0
+frames = []
+
+
+def render_frame(level: float) -> bytes:
+    """Renders a noisy frame with the tank's sight glass filled to level percent."""
+    rng = np.random.default_rng(int(level * 100))
+    image = rng.integers(90, 150, (FRAME_HEIGHT, FRAME_WIDTH, 3), dtype=np.uint8)
+    x1, y1, x2, y2 = TANK_REGION
+    fill_y = y2 - int((y2 - y1) * level / 100)
+    # Oil is dark, the empty part of the sight glass is bright
+    image[y1:fill_y, x1:x2] = 220
+    image[fill_y:y2, x1:x2] = 40
+    _, encoded_image = cv2.imencode(".jpg", image, [cv2.IMWRITE_JPEG_QUALITY, 85])
+    return encoded_image.tobytes()
+
+
+def level_for(camera_id: int) -> float:
+    # Each camera starts at a different point of the drain cycle
+    phase = (time.time() / DRAIN_PERIOD + camera_id * 0.37) % 1.0
+    return 100 * (1 - phase)
+
+
+@app.get("/cam/{camera_id}/image.jpg")
+async def snapshot(camera_id: int):
+    delay = latency + random.uniform(0, jitter)
+    if delay:
+        await asyncio.sleep(delay)
+    frame = frames[round(level_for(camera_id) * (LEVEL_STEPS - 1) / 100)]
+    return Response(content=frame, media_type="image/jpeg")
+
+
+def main():
+    global latency, jitter, frames
+    parser = argparse.ArgumentParser(description="Serve synthetic tank snapshots.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--latency", type=float, default=0.0, help="Base delay per snapshot in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random delay up to this many seconds")
+    args = parser.parse_args()
+
+    latency, jitter = args.latency, args.jitter
+    # Pre-render so the fake camera never becomes the bottleneck
+    frames = [render_frame(level) for level in np.linspace(0, 100, LEVEL_STEPS)]
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
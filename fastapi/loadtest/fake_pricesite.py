@@ -0,0 +1,45 @@
+"""Fake oil price site serving a recorded baywa.de result list.
+
+Point the service at it with OILCAM_OILPRICE_URL=http://localhost:8002/.
+"""
+import argparse
+import asyncio
+import os
+import random
+
+import uvicorn
+from fastapi import FastAPI
+from fastapi.responses import HTMLResponse
+
+FIXTURE_PATH = os.path.join(os.path.dirname(__file__), "baywa_result_list.html")
+
+app = FastAPI()
+latency = 0.0
+jitter = 0.0
+with open(FIXTURE_PATH, encoding="utf-8") as f:
+    result_list_html = f.read()
+
+
+@app.get("/{path:path}")
+async def result_list(path: str):
+    delay = latency + random.uniform(0, jitter)
+    if delay:
+        await asyncio.sleep(delay)
+    return HTMLResponse(result_list_html)
+
+
+def main():
+    global latency, jitter
+    parser = argparse.ArgumentParser(description="Serve a recorded oil price result list.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8002)
+    parser.add_argument("--latency", type=float, default=0.0, help="Base delay per request in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random delay up to this many seconds")
+    args = parser.parse_args()
+
+    latency, jitter = args.latency, args.jitter
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""Load generator simulating Home Assistant coordinators polling the service.
+
+Each simulated tank polls /filling-data/ and /filling-image/ once per update
+cycle, like OilcamDataUpdateCoordinator and OilcamAnnotatedImage do, against
+its own fake camera. Latency percentiles, throughput and error rates are
+reported per endpoint at the end.
+"""
+import argparse
+import asyncio
+import math
+import random
+import time
+
+import httpx
+
+REGION = "1160,40,1200,1050"
+
+
+class Stats:
+    def __init__(self):
+        self.latencies = {}
+        self.errors = {}
+        # Window from the first request sent to the last response, for throughput
+        self.first_started = None
+        self.last_finished = None
+
+    def record(self, endpoint: str, started: float, finished: float, ok: bool):
+        self.latencies.setdefault(endpoint, []).append(finished - started)
+        self.errors[endpoint] = self.errors.get(endpoint, 0) + (not ok)
+        if self.first_started is None or started < self.first_started:
+            self.first_started = started
+        if self.last_finished is None or finished > self.last_finished:
+            self.last_finished = finished
+
+    def window(self) -> float:
+        if self.first_started is None:
+            return 0.0
+        return self.last_finished - self.first_started
+
+
+def percentile(sorted_values: list, pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    rank = max(math.ceil(pct / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+async def request(client: httpx.AsyncClient, stats: Stats, endpoint: str, params: dict):
+    started = time.perf_counter()
+    try:
+        response = await client.get(endpoint, params=params)
+        ok = response.status_code == 200
+        if ok and response.headers.get("content-type", "").startswith("application/json"):
+            ok = "error" not in response.json()
+    except httpx.HTTPError:
+        ok = False
+    stats.record(endpoint, started, time.perf_counter(), ok)
+
+
+async def tank(client: httpx.AsyncClient, stats: Stats, args, tank_id: int, deadline: float):
+    image_url = f"{args.camera_url}/cam/{tank_id}/image.jpg"
+    data_params = {
+        "image_url": image_url,
+        "region": REGION,
+        "threshold_min": 120,
+        "threshold_max": 255,
+        "capacity": 2400,
+        "zipcode": "97222",
+    }
+    image_params = {
+        "image_url": image_url,
+        "region": REGION,
+        "threshold_min": 120,
+        "threshold_max": 255,
+    }
+    # Coordinators are set up at different times, so spread the first polls over one cycle
+    await asyncio.sleep(min(random.uniform(0, args.update_cycle), max(deadline - time.monotonic(), 0)))
+    while time.monotonic() < deadline:
+        cycle_start = time.monotonic()
+        await request(client, stats, "/filling-data/", data_params)
+        if not args.no_image:
+            await request(client, stats, "/filling-image/", image_params)
+        await asyncio.sleep(max(args.update_cycle - (time.monotonic() - cycle_start), 0))
+
+
+def report(stats: Stats):
+    # Only the time requests were in flight counts, not the initial spread or idle tail
+    window = stats.window()
+    print(f"{'window':<18} {window:.1f}s")
+    print(f"{'endpoint':<18} {'requests':>9} {'req/s':>8} {'errors':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for endpoint, latencies in sorted(stats.latencies.items()):
+        latencies.sort()
+        errors = stats.errors[endpoint]
+        print(
+            f"{endpoint:<18} {len(latencies):>9} {len(latencies) / window if window else 0:>8.2f} "
+            f"{100 * errors / len(latencies):>7.1f}% "
+            f"{1000 * percentile(latencies, 50):>9.1f} {1000 * percentile(latencies, 95):>9.1f} "
+            f"{1000 * percentile(latencies, 99):>9.1f}"
+        )
+
+
+async def run(args):
+    stats = Stats()
+    limits = httpx.Limits(max_connections=args.max_connections)
+    timeout = httpx.Timeout(args.timeout)
+    deadline = time.monotonic() + args.duration
+    async with httpx.AsyncClient(base_url=args.target, limits=limits, timeout=timeout) as client:
+        await asyncio.gather(*(tank(client, stats, args, tank_id, deadline) for tank_id in range(args.tanks)))
+    report(stats)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate Home Assistant coordinators polling the Oilcam service.")
+    parser.add_argument("--target", default="http://127.0.0.1:8000", help="Oilcam service base URL")
+    parser.add_argument("--camera-url", default="http://127.0.0.1:8001", help="Fake camera base URL")
+    parser.add_argument("--tanks", type=int, default=10, help="Number of simulated tanks / coordinators")
+    parser.add_argument("--update-cycle", type=float, default=300, help="Seconds between polls per tank")
+    parser.add_argument("--duration", type=float, default=600, help="Test duration in seconds")
+    parser.add_argument("--timeout", type=float, default=30, help="Request timeout in seconds")
+    parser.add_argument("--max-connections", type=int, default=1000)
+    parser.add_argument("--no-image", action="store_true", help="Only poll /filling-data/")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Filling level detection pipeline shared by app.py and reprocess.py.
+
+Only numpy/OpenCV and pure functions live here, so importing this module has no
+side effects: no logging setup, caches, executors or web app.
+"""
+import logging
+
+import numpy as np
+import cv2
+import imutils
+
+DEFAULT_THRESHOLD_MIN = 120
+
+logger = logging.getLogger(__name__)
+
+
+def debug_log(message: str):
+    logger.info(message)
+
+
+def preprocess_image(image, region):
+    """Processes the image by converting it to grayscale and applying blur."""
+    debug_log(f"Preprocessing image with region: {region}")
+    x1, y1, x2, y2 = map(int, region.split(','))
+    
+    img_gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    img_blur = cv2.GaussianBlur(img_gray, (7, 7), 0)
+    img_crop = img_blur[y1:y2, x1:x2]
+    img_inv = cv2.bitwise_not(img_crop)
+    
+    debug_log("Image preprocessing complete")
+    return img_inv
+
+
+def apply_threshold(image, min_val, max_val):
+    """Applies a binary threshold to the image."""
+    debug_log(f"Applying threshold: min={min_val}, max={max_val}")
+    _, img_thresh = cv2.threshold(image, min_val, max_val, cv2.THRESH_BINARY)
+    # Apply morphological opening to remove noise
+    kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (5, 5))
+    img_thresh = cv2.morphologyEx(img_thresh, cv2.MORPH_OPEN, kernel)
+    return img_thresh
+
+
+def find_biggest_contour(image):
+    """Finds the largest contour in the processed image."""
+    contours = cv2.findContours(image.copy(), cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    contours = imutils.grab_contours(contours)
+    if not contours:
+        debug_log("No contours found")
+        return None
+    largest_contour = max(contours, key=cv2.contourArea)
+    return cv2.boundingRect(largest_contour)
+
+
+def threshold_sweep(image):
+    """Computes the detected filling height for every threshold 0-255.
+
+    Runs the same threshold, opening and largest-contour steps as apply_threshold and
+    find_biggest_contour for each threshold, without logging every step.
+    """
+    kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (5, 5))
+    heights = np.zeros(256, dtype=np.int32)
+    for t in range(256):
+        _, img_thresh = cv2.threshold(image, t, 255, cv2.THRESH_BINARY)
+        img_thresh = cv2.morphologyEx(img_thresh, cv2.MORPH_OPEN, kernel)
+        contours = imutils.grab_contours(cv2.findContours(img_thresh, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE))
+        if contours:
+            heights[t] = cv2.boundingRect(max(contours, key=cv2.contourArea))[3]
+    return heights
+
+
+def find_plateau_threshold(heights, full_height: int, tolerance: int):
+    """Returns the middle of the widest threshold range whose height stays within tolerance."""
+    # Ignore thresholds that detect nothing or saturate the whole region
+    valid = (heights > 0) & (heights < full_height)
+    best = None
+    start = None
+    for t in range(257):
+        if start is not None and t < 256 and valid[t] and abs(int(heights[t]) - int(heights[start])) <= tolerance:
+            continue
+        if start is not None and (best is None or t - start > best[1] - best[0]):
+            best = (start, t)
+        start = t if t < 256 and valid[t] else None
+    if best is None:
+        return None
+    return (best[0] + best[1] - 1) // 2
+
+
+def get_filling_level(filling_height, region):
+    # Parse region and extract coordinates
+    _, y1, _, y2 = map(int, region.split(','))
+    # Calculate filling level as a percentage of the total height
+    full_height = y2-y1
+    filling_level = (filling_height / full_height) * 100 if full_height else 0
+    return round(filling_level, 1)  # Round to 1 decimal place
+
+
+def calculate_capacity(filling_level, capacity):
+    filled_capacity = round((filling_level / 100) * capacity)
+    empty_capacity = round(capacity - filled_capacity)
+    return empty_capacity, filled_capacity
@@ -0,0 +1,287 @@
+"""Reprocess archived frames offline with the detection pipeline used by app.py.
+
+Usage:
+    python reprocess.py frames/ --region 1160,40,1200,1050 --output levels.csv
+    python reprocess.py frames.tar.gz --threshold-min 130 --output levels.parquet --workers 8
+    python reprocess.py $OILCAM_ARCHIVE_DIR --output levels.csv
+    python reprocess.py $OILCAM_ARCHIVE_DIR --camera http://192.168.42.4/image.jpg --calibration-file calibration.json
+
+Archive directories written by app.py (OILCAM_ARCHIVE_DIR) are read through their
+index, using the region stored with each reading and keeping its camera and source
+region in the output. With --calibration-file, each camera's stored threshold is
+used instead of --threshold-min.
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+import tarfile
+import time
+from collections import deque
+from datetime import datetime
+from multiprocessing import Pool
+
+import numpy as np
+import cv2
+
+import pipeline
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".webp")
+COLUMNS = ["frame", "timestamp", "camera", "source_region", "contour_height", "filling_level", "filled_capacity", "empty_capacity", "error"]
+PARQUET_BATCH_SIZE = 1000
+PROGRESS_INTERVAL = 5.0  # seconds between progress reports
+
+# Per-worker state, set up once by init_worker
+worker_options = None
+
+
+def init_worker(options: dict):
+    global worker_options
+    worker_options = options
+
+
+def list_frames(source: str, camera: str | None = None):
+    """Returns (name, timestamp, path, entry) for every image in an archive or directory tree.
+
+    entry is the archive index entry, or None for plain directories; camera filters
+    archive readings by their (credential-free) camera URL.
+    """
+    frames = []
+    index_path = os.path.join(source, "index.jsonl")
+    if os.path.isfile(index_path):
+        with open(index_path) as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # Truncated by a crash while appending
+                    continue
+                if camera is not None and entry.get("camera") != camera:
+                    continue
+                path = os.path.join(source, entry["object"])
+                if os.path.exists(path):
+                    frames.append((entry["object"], entry["ts"], path, entry))
+        # The index is already in reading order
+        return frames
+    for root, _, files in os.walk(source):
+        for name in files:
+            if name.lower().endswith(IMAGE_EXTENSIONS):
+                path = os.path.join(root, name)
+                frames.append((os.path.relpath(path, source), file_timestamp(os.path.getmtime(path)), path, None))
+    frames.sort(key=lambda frame: frame[0])
+    return frames
+
+
+def load_calibrations(path: str) -> dict:
+    """Loads the per-camera thresholds stored by app.py's /filling-calibrate/."""
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        sys.exit(f"Failed to read calibration file {path}: {e}")
+
+
+def iter_tar_frames(source: str):
+    """Yields (name, timestamp, data, entry) in tar order; tars carry no index entries.
+
+    The tar is read in a single sequential pass in the main process, so compressed
+    tarballs are decompressed once instead of once per seek in every worker.
+    """
+    with tarfile.open(source, mode="r|*") as tar:
+        for member in tar:
+            if member.isfile() and member.name.lower().endswith(IMAGE_EXTENSIONS):
+                yield member.name, file_timestamp(member.mtime), tar.extractfile(member).read(), None
+
+
+def file_timestamp(mtime: float) -> str:
+    return datetime.utcfromtimestamp(mtime).isoformat()
+
+
+def read_frame(handle) -> bytes:
+    """Returns the frame bytes; tar frames arrive as bytes, others as a path."""
+    if isinstance(handle, bytes):
+        return handle
+    with open(handle, "rb") as f:
+        return f.read()
+
+
+def process_frame(frame) -> dict:
+    """Runs the detection pipeline on one archived frame."""
+    name, timestamp, handle, entry = frame
+    entry = entry or {}
+    row = {
+        "frame": name,
+        "timestamp": timestamp,
+        "camera": entry.get("camera"),
+        "source_region": entry.get("source_region"),
+    }
+    try:
+        image_cv = cv2.imdecode(np.frombuffer(read_frame(handle), np.uint8), cv2.IMREAD_COLOR)
+        if image_cv is None:
+            raise ValueError("Failed to decode image")
+        region = entry.get("region") or worker_options["region"]
+        # Calibrations are keyed by camera and the region in the full frame
+        calibration_key = f"{entry.get('camera')}|{entry.get('source_region')}"
+        threshold_min = worker_options["calibrations"].get(calibration_key, worker_options["threshold_min"])
+        image_ready = pipeline.preprocess_image(image_cv, region)
+        image_thresh = pipeline.apply_threshold(image_ready, threshold_min, worker_options["threshold_max"])
+        contour = pipeline.find_biggest_contour(image_thresh)
+        if contour is None:
+            raise ValueError("No contours found")
+        h = contour[3]
+        filling_level = pipeline.get_filling_level(h, region)
+        empty_capacity, filled_capacity = pipeline.calculate_capacity(filling_level, worker_options["capacity"])
+        row.update(
+            contour_height=h,
+            filling_level=filling_level,
+            filled_capacity=filled_capacity,
+            empty_capacity=empty_capacity,
+        )
+    except Exception as e:
+        row["error"] = str(e)
+    return row
+
+
+def process_chunk(chunk: list) -> list:
+    return [process_frame(frame) for frame in chunk]
+
+
+def chunked(frames, size: int):
+    chunk = []
+    for frame in frames:
+        chunk.append(frame)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def imap_bounded(pool, frames, chunksize: int, max_pending: int):
+    """Like pool.imap over chunks, but reads ahead at most max_pending chunks.
+
+    Pool.imap drains its input eagerly, which would load a whole tarball into memory.
+    """
+    pending = deque()
+    for chunk in chunked(frames, chunksize):
+        pending.append(pool.apply_async(process_chunk, (chunk,)))
+        if len(pending) >= max_pending:
+            yield from pending.popleft().get()
+    while pending:
+        yield from pending.popleft().get()
+
+
+class CsvWriter:
+    def __init__(self, path: str):
+        self._file = open(path, "w", newline="")
+        self._writer = csv.DictWriter(self._file, fieldnames=COLUMNS)
+        self._writer.writeheader()
+
+    def write(self, row: dict):
+        self._writer.writerow(row)
+
+    def close(self):
+        self._file.close()
+
+
+class ParquetWriter:
+    def __init__(self, path: str):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            sys.exit("Parquet output requires pyarrow (pip install pyarrow)")
+        self._pa = pa
+        self._schema = pa.schema([
+            ("frame", pa.string()),
+            ("timestamp", pa.string()),
+            ("camera", pa.string()),
+            ("source_region", pa.string()),
+            ("contour_height", pa.int64()),
+            ("filling_level", pa.float64()),
+            ("filled_capacity", pa.int64()),
+            ("empty_capacity", pa.int64()),
+            ("error", pa.string()),
+        ])
+        self._writer = pq.ParquetWriter(path, self._schema)
+        self._rows = []
+
+    def write(self, row: dict):
+        self._rows.append(row)
+        if len(self._rows) >= PARQUET_BATCH_SIZE:
+            self._flush()
+
+    def _flush(self):
+        if self._rows:
+            columns = {name: [row.get(name) for row in self._rows] for name in COLUMNS}
+            self._writer.write_table(self._pa.Table.from_pydict(columns, schema=self._schema))
+            self._rows = []
+
+    def close(self):
+        self._flush()
+        self._writer.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Recompute filling levels from archived frames.")
+    parser.add_argument("source", help="Frame archive, directory or tar file of archived frames")
+    parser.add_argument("--output", default="reprocessed.csv", help="Output file (.csv or .parquet)")
+    parser.add_argument("--region", default="1160,40,1200,1050", help="Ignored for frame archives")
+    parser.add_argument("--threshold-min", type=int, default=pipeline.DEFAULT_THRESHOLD_MIN)
+    parser.add_argument("--camera", help="Only reprocess archive readings from this camera URL (without credentials)")
+    parser.add_argument("--calibration-file", help="Use each camera's calibrated threshold from this calibration.json")
+    parser.add_argument("--threshold-max", type=int, default=255)
+    parser.add_argument("--capacity", type=int, default=2400)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--chunksize", type=int, default=32)
+    args = parser.parse_args()
+
+    if os.path.isdir(args.source):
+        frames = list_frames(args.source, args.camera)
+        if not frames:
+            sys.exit(f"No frames found in {args.source}")
+        total = len(frames)
+        print(f"Reprocessing {total} frames with {args.workers} workers", file=sys.stderr)
+    else:
+        frames = iter_tar_frames(args.source)
+        total = None
+        print(f"Reprocessing frames from {args.source} with {args.workers} workers", file=sys.stderr)
+
+    options = {
+        "region": args.region,
+        "threshold_min": args.threshold_min,
+        "calibrations": load_calibrations(args.calibration_file) if args.calibration_file else {},
+        "threshold_max": args.threshold_max,
+        "capacity": args.capacity,
+    }
+    writer = ParquetWriter(args.output) if args.output.endswith(".parquet") else CsvWriter(args.output)
+
+    started = time.monotonic()
+    last_report = started
+    done = errors = 0
+    try:
+        with Pool(args.workers, initializer=init_worker, initargs=(options,)) as pool:
+            # Results stream to the writer in frame order as soon as they are ready
+            for row in imap_bounded(pool, frames, args.chunksize, 2 * args.workers):
+                writer.write(row)
+                done += 1
+                errors += "error" in row
+                now = time.monotonic()
+                if now - last_report >= PROGRESS_INTERVAL:
+                    progress = f"{done}/{total}" if total else f"{done}"
+                    print(f"{progress} frames, {done / (now - started):.1f} frames/s", file=sys.stderr)
+                    last_report = now
+    finally:
+        writer.close()
+
+    elapsed = time.monotonic() - started
+    print(
+        f"Processed {done} frames ({errors} errors) in {elapsed:.1f}s, "
+        f"{done / elapsed:.1f} frames/s -> {args.output}",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()